@@ -0,0 +1,45 @@
+"""
+Pytest plugin, registered through the `pytest11` entry point so that pytest is only
+imported when it is actually running.
+Drops into RichPdb on test failure when `--nicerpdb` is passed.
+
+@author: Baptiste Pestourie
+@date: 26.11.2025
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from nicerpdb.debugger import RichPdb
+
+if TYPE_CHECKING:
+    from pytest import CallInfo, Collector, Item, Parser
+
+
+def pytest_addoption(parser: Parser) -> None:
+    group = parser.getgroup("nicerpdb")
+    group.addoption(
+        "--nicerpdb",
+        action="store_true",
+        default=False,
+        help="start nicerpdb on errors (use along with -s)",
+    )
+
+
+@pytest.hookimpl()
+def pytest_exception_interact(node: Item | Collector, call: CallInfo, report: object):
+    if not node.config.getoption("nicerpdb"):
+        return
+    # Extract the real traceback object (etype, evalue, tb)
+    *_, tb = call.excinfo._excinfo
+    last_tb = tb
+    while last_tb.tb_next is not None:
+        last_tb = last_tb.tb_next
+
+    frame = last_tb.tb_frame
+    debugger = RichPdb()
+    debugger.reset()
+    debugger.interaction(frame, tb)
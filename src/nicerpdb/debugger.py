@@ -15,32 +15,56 @@ Enhancements:
 
 from __future__ import annotations
 
+import atexit
 import inspect
 import linecache
 import os
 import pdb
 import subprocess
 import sys
+import traceback
 from dataclasses import dataclass
-from functools import partialmethod
-from tkinter import Frame
+from functools import lru_cache, partialmethod
+from itertools import islice
 from types import FrameType, TracebackType
-from typing import Any, Callable, Protocol, TypeAlias, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Protocol, TypeAlias, TypeVar
 
-try:
-    import tomllib  # Py3.11+
-except ImportError:
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
     import tomli as tomllib  # type: ignore[no-redef]
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.pretty import Pretty
-from rich.syntax import Syntax
-from rich.table import Table
-from rich.traceback import Traceback
+if TYPE_CHECKING:
+    from pygments.lexers.python import PythonLexer
+    from rich.console import Console
+    from rich.highlighter import ReprHighlighter
+    from rich.pretty import Pretty
+    from rich.syntax import Syntax
+    from rich.text import Text
+
+# Global console, created along with the rich imports on first use
+console: Console | None = None
+
+
+def _console() -> Console:
+    """Return the global console, importing rich on first call."""
+    global console
+    if console is None:
+        from rich.console import Console
+
+        console = Console()
+    return console
+
+
+@lru_cache(maxsize=None)
+def _python_lexer() -> PythonLexer:
+    """Shared lexer, saves a lexer lookup and instantiation on every listing."""
+    from pygments.lexers.python import PythonLexer
+
+    # Same options Rich uses for lexers it builds by name: leading blank lines must be kept,
+    # otherwise line numbers and the highlighted line are shifted
+    return PythonLexer(stripnl=False, ensurenl=True)
 
-# Global console
-console: Console = Console()
 
 ExcInfo: TypeAlias = tuple[type[BaseException], BaseException, TracebackType]
 OptExcInfo: TypeAlias = ExcInfo | tuple[None, None, None]
@@ -58,24 +82,145 @@ class NicerPdbConfig:
     context_lines: int = 10
     show_locals: bool = True
     show_stack: bool = True
+    max_locals: int = 50
+    sort_locals: bool = False
 
 
 DEFAULT_CONFIG_PATH = "~/.nicerpdb.toml"
+# Above this many locals, `sort_locals` is ignored
+MAX_SORTED_LOCALS = 200
+# Lines rendered on each side of the current line by `longlist`
+LONGLIST_WINDOW = 500
+
+
+@lru_cache(maxsize=None)
+def _default_config_path() -> str:
+    return os.path.expanduser(DEFAULT_CONFIG_PATH)
 
 
 def load_config(config_path: str | None = None) -> NicerPdbConfig:
     """Load ~/.nicerpdb.toml if present."""
-    config_path = config_path or os.path.expanduser("~/.nicerpdb.toml")
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, "rb") as f:
-                loaded = tomllib.load(f)
-                return NicerPdbConfig(**loaded)
-        except Exception as exc:
-            console.print(f"[yellow]Warning: error reading ~/.nicerpdb.toml: {exc}[/]")
+    config_path = config_path or _default_config_path()
+    try:
+        with open(config_path, "rb") as f:
+            loaded = tomllib.load(f)
+        return NicerPdbConfig(**loaded)
+    except FileNotFoundError:
+        pass
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError, TypeError) as exc:
+        # UnicodeDecodeError: file is not UTF-8, TypeError: unknown keys in the config file
+        _console().print(f"[yellow]Warning: error reading {config_path}: {exc}[/]")
     return NicerPdbConfig()
 
 
+# Loaded on first debugger construction rather than at import time
+_config: NicerPdbConfig | None = None
+
+
+def _get_config() -> NicerPdbConfig:
+    """Return the user configuration, loading it on first access."""
+    global _config
+    if _config is None:
+        _config = load_config()
+    return _config
+
+
+def _source_unavailable(filename: str) -> bool:
+    """
+    Whether `filename` is a pseudo-file such as `<string>` that linecache cannot read.
+    Same check as CPython's `linecache._source_unavailable`, which only runs once the
+    cache lookup missed: pseudo-files registered in linecache (generated code, REPL
+    inputs...) do have source. Frozen modules may have source too.
+    """
+    if filename in linecache.cache:
+        return False
+    return not filename or (
+        filename.startswith("<") and filename.endswith(">") and not filename.startswith("<frozen ")
+    )
+
+
+@lru_cache(maxsize=None)
+def _memo_syntax_class() -> type[Syntax]:
+    """`Syntax` subclass that lexes its code once, however many times it is printed."""
+    from rich.syntax import Syntax
+
+    class MemoSyntax(Syntax):
+        _highlighted: Text | None = None
+
+        def highlight(
+            self, code: str, line_range: tuple[int | None, int | None] | None = None
+        ) -> Text:
+            if self._highlighted is None:
+                self._highlighted = super().highlight(code, line_range)
+            # rendering modifies the returned text, hand out copies
+            return self._highlighted.copy()
+
+    return MemoSyntax
+
+
+def _make_syntax(filename: str, start: int, end: int, highlight: int) -> Syntax:
+    """Build the highlighted `Syntax` for lines [start, end) of `filename`."""
+    lines = linecache.getlines(filename)
+    return _memo_syntax_class()(
+        "".join(lines[start:end]),
+        _python_lexer(),
+        line_numbers=True,
+        start_line=start + 1,
+        highlight_lines={highlight},
+        indent_guides=True,
+    )
+
+
+@lru_cache(maxsize=16)
+def _build_syntax(
+    filename: str, start: int, end: int, highlight: int, version: tuple[int, float]
+) -> Syntax:
+    """
+    Cached `_make_syntax`, repeated listings of the same frame reuse the already lexed code.
+    `version` is only part of the key so that reloaded files get rebuilt.
+    """
+    return _make_syntax(filename, start, end, highlight)
+
+
+def _source_syntax(
+    filename: str, start: int, end: int, highlight: int, *, cache: bool = True
+) -> Syntax:
+    """`Syntax` for lines [start, end) of `filename`, cached when linecache tracks the file."""
+    # linecache records (size, mtime) for files read from disk, pseudo-files have no mtime
+    entry = linecache.cache.get(filename)
+    if cache and entry is not None and len(entry) == 4 and entry[1] is not None:
+        return _build_syntax(filename, start, end, highlight, (entry[0], entry[1]))
+    return _make_syntax(filename, start, end, highlight)
+
+
+# Values whose repr is already as good as what Pretty would render
+_SIMPLE_TYPES: frozenset[type] = frozenset((int, float, bool, str, type(None)))
+
+
+@lru_cache(maxsize=None)
+def _repr_highlighter() -> ReprHighlighter:
+    """Shared highlighter, colors scalar reprs the same way Pretty does."""
+    from rich.highlighter import ReprHighlighter
+
+    return ReprHighlighter()
+
+
+def _fast_repr(value: object) -> Text | Pretty:
+    """Highlighted repr for builtin scalars, falls back to Pretty for anything else."""
+    from rich.pretty import Pretty
+
+    if type(value) in _SIMPLE_TYPES:
+        # Highlighting a str yields Text, reprs are never interpreted as console markup
+        return _repr_highlighter()(repr(value))
+    return Pretty(value, max_length=150)
+
+
+def _hidden_rows_note(count: int, kind: str) -> Text:
+    from rich.text import Text
+
+    return Text(f"{count} more {kind} hidden, use `locals_all` to show them", style="dim")
+
+
 CmdRet = TypeVar("CmdRet", bound=bool | None, covariant=True)
 
 
@@ -111,11 +256,23 @@ class RichPdb(pdb.Pdb):
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
-        self.config = config or load_config()
+        self.config = config or _get_config()
 
         # Clean simple prompt
         self.prompt: str = " (nicerpdb) > "
         self.errors: list[str] = []
+        # pdb emits output in many small fragments, buffer them until a full line is available
+        self._line_buffer: list[str] = []
+        # Set when the debugger stops, the next source panel then announces the stop
+        self._stop_banner: bool = False
+
+    def _flush(self) -> None:
+        """Write out any buffered message fragments in a single console call."""
+        if not self._line_buffer:
+            return
+        text = "".join(self._line_buffer)
+        self._line_buffer.clear()
+        _console().print(text, end="", markup=False, highlight=False)
 
     def print_stack_trace(self, depth: int = 5) -> None:
         try:
@@ -155,49 +312,63 @@ class RichPdb(pdb.Pdb):
         highlighting. The current line is highlighted by Syntax's highlight_lines; panel
         and border styles are chosen to be soft on dark backgrounds.
         """
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+
         frame, lineno = frame_lineno
         code = frame.f_code
         filename = code.co_filename
         funcname = code.co_name
+        stop_banner, self._stop_banner = self._stop_banner, False
 
         # Compute snippet range (1-based lines)
         start = max(1, lineno - context)
         end = lineno + context
 
         # Read the lines; linecache returns '' for missing lines so join is safe
-        snippet_lines: list[str] = [
-            (linecache.getline(filename, i) or "") for i in range(start, end + 1)
-        ]
-        snippet = "".join(snippet_lines)
+        snippet = ""
+        if not _source_unavailable(filename):
+            snippet_lines: list[str] = [
+                (linecache.getline(filename, i) or "") for i in range(start, end + 1)
+            ]
+            snippet = "".join(snippet_lines)
 
         # Build a one-line header (keeps compatibility with pdb callers)
         header = self.format_stack_entry(frame_lineno, lprefix=(prompt_prefix or ""))
+        self._flush()
 
         # Syntax block with the current line highlighted.
         # Rich's Syntax will visually distinguish highlighted lines; we choose a soft panel/border style
         # that reads well on dark backgrounds.
-        console.print(header)
         if not snippet.strip():
+            # No panel to carry the stop banner, announce it on the header line instead
+            if stop_banner:
+                header = f"[bold magenta]Debugger stopped[/] {header}"
+            _console().print(header)
             return
+        _console().print(header)
         syntax = Syntax(
             snippet,
-            "python",
+            _python_lexer(),
             line_numbers=True,
             start_line=start,
             highlight_lines={lineno},
             word_wrap=False,
         )
 
+        title = f"[bold]{funcname} — {filename}:{lineno}[/]"
+        if stop_banner:
+            title = f"[bold magenta]Debugger stopped[/] {title}"
         panel = Panel(
             syntax,
-            title=f"[bold]{funcname} — {filename}:{lineno}[/]",
+            title=title,
             border_style="grey37",
             padding=(0, 1),
         )
 
         # Print header (plain) then the panel. The header keeps textual compatibility; the panel
         # provides the rich highlighted context. No extra "current frame" messages are printed.
-        console.print(panel)
+        _console().print(panel)
 
     @property
     def show_locals(self) -> bool:
@@ -211,49 +382,66 @@ class RichPdb(pdb.Pdb):
     def show_stack(self) -> bool:
         return self.config.show_stack
 
+    @property
+    def max_locals(self) -> int:
+        return self.config.max_locals
+
+    @property
+    def sort_locals(self) -> bool:
+        return self.config.sort_locals
+
     # -------------------- Rendering Helpers ----------------------------
 
     def _render_source_block(self, filename: str, lineno: int, context: int) -> None:
         """Render snippet around a target line using Syntax."""
+        from rich.panel import Panel
+
+        self._flush()
+        if _source_unavailable(filename):
+            _console().print(f"[dim]<no source: {filename}>[/]")
+            return
         lines = linecache.getlines(filename)
         if not lines:
-            console.print(f"[italic]Cannot read source from {filename}[/]")
+            _console().print(f"[italic]Cannot read source from {filename}[/]")
             return
 
         start = max(0, lineno - 1 - context)
         end = min(len(lines), lineno - 1 + context + 1)
-        snippet = "".join(lines[start:end])
-
-        syntax = Syntax(
-            snippet,
-            "python",
-            line_numbers=True,
-            start_line=start + 1,
-            highlight_lines={lineno},
-            indent_guides=True,
-        )
+        syntax = _source_syntax(filename, start, end, lineno)
+        _console().print(Panel(syntax, title=f"{filename}:{lineno}", expand=True))
 
-        console.print(Panel(syntax, title=f"{filename}:{lineno}", expand=True))
+    def _render_full_file(
+        self, filename: str, lineno: int, window: int | None = LONGLIST_WINDOW
+    ) -> None:
+        """
+        Full source listing (ll).
+        Only `window` lines on each side of `lineno` are rendered, `None` renders the whole file.
+        """
+        from rich.panel import Panel
 
-    def _render_full_file(self, filename: str, lineno: int) -> None:
-        """Full source listing (ll)."""
+        self._flush()
+        if _source_unavailable(filename):
+            _console().print(f"[dim]<no source: {filename}>[/]")
+            return
         lines = linecache.getlines(filename)
         if not lines:
-            console.print(f"[italic]Cannot read file {filename}[/]")
+            _console().print(f"[italic]Cannot read file {filename}[/]")
             return
 
-        text = "".join(lines)
-        syntax = Syntax(
-            text,
-            "python",
-            line_numbers=True,
-            highlight_lines={lineno},
-            indent_guides=True,
-        )
-        console.print(Panel(syntax, title=f"Full source: {filename}", expand=True))
+        start, end = 0, len(lines)
+        if window is not None:
+            start = max(0, lineno - 1 - window)
+            end = min(len(lines), lineno + window)
+        # whole-file listings can be arbitrarily large, keep them out of the cache
+        syntax = _source_syntax(filename, start, end, lineno, cache=window is not None)
+        title = f"Full source: {filename}"
+        if (start, end) != (0, len(lines)):
+            title += f" \\[lines {start + 1}-{end} of {len(lines)}]"
+        _console().print(Panel(syntax, title=title, expand=True))
 
     def print_error(self, error: str) -> None:
-        console.print(f"[red]Error:[/] {error}")
+        self._flush()
+        _console().print(f"[red]Error:[/] {error}")
 
     def build_call_stack(
         self,
@@ -267,18 +455,16 @@ class RichPdb(pdb.Pdb):
         if start_frame is None:
             return stack
 
-        cur: FrameType | None = start_frame
-
-        while cur:
-            stack.append(cur)
-            cur = cur.f_back
-            if max_depth is not None and len(stack) == max_depth:
-                break
+        frames = (frame for frame, _ in traceback.walk_stack(start_frame))
+        stack.extend(islice(frames, max_depth))
         if reversed:
             stack.reverse()
         return stack
 
     def _render_stack(self) -> None:
+        from rich.table import Table
+
+        self._flush()
         stack = self.build_call_stack()
 
         table = Table(title="Stack (most recent last)", expand=True)
@@ -287,47 +473,85 @@ class RichPdb(pdb.Pdb):
         table.add_column("Location")
         table.add_column("Context excerpt")
 
+        getline = linecache.getline
         for i, fr in enumerate(stack, start=1):
             code = fr.f_code
             fname = code.co_filename
             ln = fr.f_lineno
             func = code.co_name
 
-            ctx = ""
-            src = linecache.getlines(fname)
-            if src:
-                a = max(0, ln - 2)
-                b = min(len(src), ln + 1)
-                ctx = " ".join(l.strip() for l in src[a:b])
-                if len(ctx) > 120:
-                    ctx = ctx[:117] + "..."
+            if _source_unavailable(fname):
+                table.add_row(str(i), func, f"{fname}:{ln}", "")
+                continue
+            # getline returns '' for out-of-range lines, no bounds checking needed
+            ctx = " ".join(
+                (
+                    getline(fname, ln - 1).strip(),
+                    getline(fname, ln).strip(),
+                    getline(fname, ln + 1).strip(),
+                )
+            ).strip()
+            if len(ctx) > 120:
+                ctx = ctx[:117] + "..."
 
             table.add_row(str(i), func, f"{fname}:{ln}", ctx)
 
-        console.print(table)
+        _console().print(table)
+
+    def _render_vars(self, frame: FrameType, max_rows: int | None = None) -> None:
+        """
+        Render the locals and selected globals of `frame`.
+        Only the first `max_rows` entries of each table are rendered, the rest is summarized
+        in a trailing row. `None` renders everything.
+        """
+        from rich.table import Table
 
-    def _render_vars(self, frame: FrameType) -> None:
+        self._flush()
         locals_table = Table(title="Locals", expand=True)
         locals_table.add_column("Name", style="bold")
         locals_table.add_column("Value")
 
-        for k, v in sorted(frame.f_locals.items()):
-            locals_table.add_row(k, Pretty(v, max_length=150))
-
-        globals_table = Table(title="Globals (selected)", expand=True)
+        # Definition order by default, sorting large frames on every stop is not worth it
+        local_items = list(frame.f_locals.items())
+        skipped_sort = self.sort_locals and len(local_items) > MAX_SORTED_LOCALS
+        if self.sort_locals and not skipped_sort:
+            local_items.sort()
+        locals_rows = [(k, _fast_repr(v)) for k, v in local_items[:max_rows]]
+        add_local = locals_table.add_row
+        for row in locals_rows:
+            add_local(*row)
+        if len(local_items) > len(locals_rows):
+            add_local("…", _hidden_rows_note(len(local_items) - len(locals_rows), "locals"))
+
+        # Globals come first on screen, so they carry the stop banner when there is one
+        globals_title = "Globals (selected)"
+        if self._stop_banner:
+            self._stop_banner = False
+            globals_title = f"[bold magenta]Debugger stopped[/] {globals_title}"
+        globals_table = Table(title=globals_title, expand=True)
         globals_table.add_column("Name")
         globals_table.add_column("Value")
 
         g = frame.f_globals
-        co_names = set(getattr(frame.f_code, "co_names", ()))
-        names = co_names | {"__name__", "__file__"}
-
-        for name in names:
-            if name in g:
-                globals_table.add_row(name, Pretty(g[name], max_length=150))
-
-        console.print(globals_table)
-        console.print(locals_table)
+        # co_names holds unique names already, only the extra dunders need deduplicating
+        global_names = [name for name in frame.f_code.co_names if name in g]
+        global_names += [
+            name for name in ("__name__", "__file__") if name in g and name not in global_names
+        ]
+        globals_rows = [(name, _fast_repr(g[name])) for name in global_names[:max_rows]]
+        add_global = globals_table.add_row
+        for row in globals_rows:
+            add_global(*row)
+        if len(global_names) > len(globals_rows):
+            add_global("…", _hidden_rows_note(len(global_names) - len(globals_rows), "globals"))
+
+        _console().print(globals_table)
+        _console().print(locals_table)
+        if skipped_sort:
+            _console().print(
+                f"[yellow]Warning: {len(local_items)} locals, "
+                "too many to sort, showing them in definition order[/]"
+            )
 
     def resolve_cmd_variables(self, cmd: str) -> str:
         args = cmd.split()
@@ -354,6 +578,8 @@ class RichPdb(pdb.Pdb):
         """
         Runs a shell command within the debugger session.
         """
+        from rich.syntax import Syntax
+
         cmd = arg
         if format:
             try:
@@ -365,49 +591,66 @@ class RichPdb(pdb.Pdb):
             cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
         )
         output = proc.stdout if not pretty else Syntax(proc.stdout, "shell")
-        console.print(output)
+        _console().print(output)
         if proc.stderr:
             output = proc.stderr if not pretty else Syntax(proc.stderr, "shell")
-            console.print(f"[red]{output}[/]")
+            _console().print(f"[red]{output}[/]")
 
     # -------------------- Interaction Override --------------------------
 
     def interaction(self, frame: FrameType | None, traceback_obj: Any) -> None:
         """Main entry when debugger stops."""
-        console.rule("[bold magenta]Debugger stopped[/bold magenta]")
+        self._stop_banner = True
         try:
             if frame is not None:
                 if self.show_locals:
-                    self._render_vars(frame)
+                    self._render_vars(frame, max_rows=self.max_locals)
                 if self.show_stack:
                     self.print_stack_trace(depth=1)
         except Exception:
-            console.print(Traceback.from_exception(*sys.exc_info()))
+            if _console().is_terminal:
+                from rich.traceback import Traceback
+
+                _console().print(Traceback.from_exception(*sys.exc_info()))
+            else:
+                traceback.print_exc(file=_console().file)
 
         super().interaction(frame, traceback_obj)
 
     # -------------------- Command overrides ------------------------------
 
     def default(self, line: str) -> None:
+        from rich.pretty import Pretty
+
         line = line.strip()
         if not line:
             return
         try:
             val = self._getval(line)
-            console.print(Pretty(val, max_length=300))
+            _console().print(Pretty(val, max_length=300), markup=False)
             return
         except Exception:
             super().default(line)
 
     def do_p(self, arg: str) -> None:
+        from rich.pretty import Pretty
+
         if not arg.strip():
-            console.print("[italic]Usage: p <expr>[/]")
+            _console().print("[italic]Usage: p <expr>[/]")
             return
         try:
-            console.print(Pretty(self._getval(arg), max_length=300))
+            _console().print(Pretty(self._getval(arg), max_length=300), markup=False)
         except Exception as e:
             self.print_error(str(e))
 
+    def do_locals_all(self, arg: str) -> None:
+        """Render every local and selected global of the current frame."""
+        frame = self.curframe
+        if frame is None:
+            self.print_error("Running out of a frame context. Cannot show variables")
+            return
+        self._render_vars(frame)
+
     def do_where(self, arg: str) -> None:
         self._render_stack()
 
@@ -458,6 +701,14 @@ class RichPdb(pdb.Pdb):
             return
         self._render_full_file(frame.f_code.co_filename, frame.f_lineno)
 
+    def do_longlist_full(self, arg: str) -> None:
+        """Full file listing, without limiting the number of lines around the current one."""
+        frame = self.curframe
+        if frame is None:
+            self.print_error("Running out of a frame context. Cannot show source")
+            return
+        self._render_full_file(frame.f_code.co_filename, frame.f_lineno, window=None)
+
     # All shell command variant
     do_ll = do_longlist
     do_shell = partialmethod(run_shell_command, format=False, pretty=False)
@@ -470,25 +721,62 @@ class RichPdb(pdb.Pdb):
     do_fpsh = do_fprettyshell
     do_pfsh = do_fprettyshell
 
+    def preloop(self) -> None:
+        super().preloop()
+        # make sure pending output lands before the first prompt
+        self._flush()
+
+    def postcmd(self, stop: bool, line: str) -> bool:
+        self._flush()
+        return super().postcmd(stop, line)
+
+    def error(self, msg: str) -> None:
+        # pdb writes errors straight to stdout, buffered messages must land first
+        self._flush()
+        super().error(msg)
+
     def message(self, msg: str) -> None:
-        if msg:
-            console.print(msg, end="")
+        if not msg:
+            return
+        self._line_buffer.append(msg)
+        if msg.endswith("\n"):
+            self._flush()
 
 
 # ----------------------- Public set_trace ------------------------------
 
+# Debugger shared by successive set_trace() calls, created on first stop
+_debugger: RichPdb | None = None
 
-def set_trace(*, header: str | None = None) -> None:
-    """Drop into RichPdb."""
-    current_frame = inspect.currentframe()
-    frame = current_frame.f_back if current_frame else None
-    dbg = RichPdb()
+
+def _clear_debugger() -> None:
+    global _debugger
+    _debugger = None
+
+
+def _get_debugger() -> RichPdb:
+    """Return the shared debugger, creating it on first call."""
+    global _debugger
+    if _debugger is None:
+        _debugger = RichPdb()
+        atexit.register(_clear_debugger)
+    return _debugger
+
+
+def _set_trace(frame: FrameType | None, header: str | None = None) -> None:
+    dbg = _get_debugger()
     dbg.reset()
     if header is not None:
         dbg.message(header)
     dbg.set_trace(frame)
 
 
+def set_trace(*, header: str | None = None) -> None:
+    """Drop into RichPdb."""
+    current_frame = inspect.currentframe()
+    _set_trace(current_frame.f_back if current_frame else None, header=header)
+
+
 def post_mortem(exc_info: OptExcInfo | None = None) -> None:
     """
     Activate post-mortem debugging of the given traceback object.
@@ -501,12 +789,12 @@ def post_mortem(exc_info: OptExcInfo | None = None) -> None:
     *_, tb = exc_info
     dbg = RichPdb()
     dbg.reset()
-    console.print("[bold red]Post-mortem debugging[/]")
+    _console().print("[bold red]Post-mortem debugging[/]")
     dbg.interaction(None, tb)
 
 
 # ----------------------- Breakpoint integration ------------------------
-def breakpoint(*args: object, **kwargs: object) -> None:
+def breakpoint(*args: object, header: str | None = None, **kwargs: object) -> None:
     """Make breakpoint() invoke nicerpdb automatically."""
-    # TODO: do not allocate new trace if one has already been created
-    set_trace()
+    current_frame = inspect.currentframe()
+    _set_trace(current_frame.f_back if current_frame else None, header=header)
@@ -0,0 +1,101 @@
+"""
+Tests for the rendering helpers of nicerpdb.debugger.
+
+@author: Baptiste Pestourie
+@date: 26.11.2025
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+from rich.pretty import Pretty
+
+from nicerpdb import debugger
+from nicerpdb.debugger import NicerPdbConfig, RichPdb
+
+# Window around line 5 starts on the blank lines at the top of the file
+SOURCE = "\n\n\ndef f():\n    x = sys._getframe()\n    return x\n"
+
+
+@pytest.fixture
+def output(monkeypatch: pytest.MonkeyPatch) -> io.StringIO:
+    buffer = io.StringIO()
+    monkeypatch.setattr(debugger, "console", Console(file=buffer, color_system=None, width=80))
+    return buffer
+
+
+@pytest.fixture
+def source_file(tmp_path: Path) -> str:
+    path = tmp_path / "module.py"
+    path.write_text(SOURCE)
+    return str(path)
+
+
+def highlighted_line(rendered: str) -> str:
+    (line,) = [line for line in rendered.splitlines() if "❱" in line]
+    return line
+
+
+def test_list_highlights_current_line_after_blank_lines(
+    output: io.StringIO, source_file: str
+) -> None:
+    RichPdb(config=NicerPdbConfig())._render_source_block(source_file, 5, 2)
+    line = highlighted_line(output.getvalue())
+    assert "❱ 5" in line
+    assert "x = sys._getframe()" in line
+
+
+def test_longlist_highlights_current_line_after_blank_lines(
+    output: io.StringIO, source_file: str
+) -> None:
+    RichPdb(config=NicerPdbConfig())._render_full_file(source_file, 5)
+    line = highlighted_line(output.getvalue())
+    assert "❱ 5" in line
+    assert "x = sys._getframe()" in line
+
+
+def test_stack_entry_highlights_current_line_after_blank_lines(
+    output: io.StringIO, source_file: str
+) -> None:
+    namespace: dict[str, object] = {"sys": sys}
+    exec(compile(SOURCE, source_file, "exec"), namespace)
+    frame = namespace["f"]()  # type: ignore[operator]
+    RichPdb(config=NicerPdbConfig()).print_stack_entry((frame, 5), context=2)
+    line = highlighted_line(output.getvalue())
+    assert "❱ 5" in line
+    assert "x = sys._getframe()" in line
+
+
+def test_error_is_printed_after_pending_messages(output: io.StringIO) -> None:
+    # pdb writes errors to its stdout directly, share the buffer with the console
+    dbg = RichPdb(config=NicerPdbConfig(), stdout=output)
+    dbg.message("pending")
+    dbg.error("oops")
+    rendered = output.getvalue()
+    assert rendered.index("pending") < rendered.index("*** oops")
+
+
+def render_ansi(renderable: object) -> str:
+    console = Console(file=io.StringIO(), color_system="truecolor", force_terminal=True)
+    console.print(renderable)
+    return console.file.getvalue()  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("value", [12345, 1.5, True, None, "[red]not markup[/]"])
+def test_fast_repr_renders_scalars_like_pretty(value: object) -> None:
+    assert render_ansi(debugger._fast_repr(value)) == render_ansi(Pretty(value))
+
+
+def test_stop_banner_is_shown_once_on_first_table(output: io.StringIO) -> None:
+    dbg = RichPdb(config=NicerPdbConfig())
+    dbg._stop_banner = True
+    dbg._render_vars(sys._getframe())
+    rendered = output.getvalue()
+    assert rendered.lstrip().startswith("Debugger stopped Globals (selected)")
+    assert rendered.count("Debugger stopped") == 1
+    assert not dbg._stop_banner